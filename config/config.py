@@ -19,6 +19,22 @@ ORACLE_ELIXIR_FILE_IDS = {
 # Google Drive base URL for direct CSV download
 GOOGLE_DRIVE_DOWNLOAD_URL = "https://drive.google.com/uc?export=download&id={file_id}"
 
+# Download URL for large files once Drive's virus-scan warning is confirmed
+DRIVE_CONFIRMED_DOWNLOAD_URL = (
+    "https://drive.usercontent.google.com/download"
+    "?id={file_id}&export=download&confirm={confirm}&uuid={uuid}"
+)
+DRIVE_TOKEN_TTL = 12 * 60 * 60  # Seconds a cached confirmation token is reused
+
+# Download settings
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # Bytes per read/write while streaming (1 MB)
+DOWNLOAD_TIMEOUT = 60  # Seconds to wait for the server between bytes
+MAX_PARALLEL_DOWNLOADS = 4  # Concurrent transfers when fetching several years
+DOWNLOAD_SLICES = 4  # Concurrent byte-range requests for a single large file
+MIN_SLICED_DOWNLOAD_SIZE = 16 << 20  # Smaller files are fetched as one stream
+PROGRESS_INTERVAL = 0.1  # Minimum seconds between download progress updates
+PREFETCH_WORKERS = 2  # Background threads for prefetch_year_data
+
 # Data directory paths
 DATA_DIR = "data"
 RAW_DATA_DIR = f"{DATA_DIR}/raw"
@@ -37,9 +53,19 @@ STYLE = 'seaborn-v0_8-darkgrid'
 # Analysis parameters
 CURRENT_YEAR = 2025
 MIN_GAMES_THRESHOLD = 5  # Minimum games for player statistics
+ANALYSIS_WORKERS = 4  # Threads used to build the EDA aggregate tables
+CLEAN_CACHE_VERSION = 2  # Bump when clean_data output changes to invalidate cached frames
+
+# CSV parsing settings
+CSV_BLOCK_SIZE = 8 << 20  # Bytes per parallel parse block (8 MB)
+NA_VALUES = ['', 'NA', 'N/A', 'null', 'NULL']
+ENCODING_SNIFF_BYTES = 64 * 1024  # Bytes sampled to detect the file encoding
+FINGERPRINT_BYTES = 4096  # Bytes hashed from each end of a file for cache checks
 
 # Column mappings and data types
-EXPECTED_COLUMNS = [
+# Ordered column list for the parser; EXPECTED_COLUMNS is the set form for
+# constant-time membership checks
+EXPECTED_COLUMNS_ORDER = (
     'gameid', 'datacompleteness', 'url', 'league', 'year', 'split', 'playoffs',
     'date', 'game', 'patch', 'playerid', 'side', 'position', 'playername',
     'teamname', 'champion', 'ban1', 'ban2', 'ban3', 'ban4', 'ban5',
@@ -55,7 +81,63 @@ EXPECTED_COLUMNS = [
     'opp_csat10', 'golddiffat10', 'xpdiffat10', 'csdiffat10', 'killsat10',
     'assistsat10', 'deathsat10', 'opp_killsat10', 'opp_assistsat10',
     'opp_deathsat10'
-]
+)
+EXPECTED_COLUMNS = frozenset(EXPECTED_COLUMNS_ORDER)
+
+# Subset of columns the EDA pipeline reads when loading straight from CSV
+EDA_COLUMNS = (
+    'gameid', 'league', 'year', 'split', 'date', 'playerid', 'side', 'position',
+    'playername', 'teamname', 'champion', 'gamelength', 'result', 'kills',
+    'deaths', 'assists', 'teamkills', 'damagetochampions', 'dpm', 'visionscore',
+    'vspm', 'totalgold', 'earnedgold', 'earned gpm', 'total cs', 'cspm'
+)
+
+# Storage dtypes applied at parse time. Nullable integer widths are sized to
+# the value range of team rows (the larger of the two row kinds), floats are
+# per-minute/share metrics, and low-cardinality text is stored as category.
+COLUMN_DTYPES = {
+    # Low-cardinality text
+    'datacompleteness': 'category', 'league': 'category', 'split': 'category',
+    'patch': 'category', 'side': 'category', 'position': 'category',
+    'teamname': 'category', 'champion': 'category',
+    'ban1': 'category', 'ban2': 'category', 'ban3': 'category',
+    'ban4': 'category', 'ban5': 'category',
+
+    # Game metadata
+    'date': 'datetime64[ms]', 'year': 'Int16', 'playoffs': 'Int8', 'game': 'Int8',
+    'gamelength': 'Int32', 'result': 'Int8',
+
+    # Combat counts
+    'kills': 'Int16', 'deaths': 'Int16', 'assists': 'Int16',
+    'teamkills': 'Int16', 'teamdeaths': 'Int16',
+    'doublekills': 'Int8', 'triplekills': 'Int8', 'quadrakills': 'Int8',
+    'pentakills': 'Int8', 'firstblood': 'Int8', 'firstbloodkill': 'Int8',
+    'firstbloodassist': 'Int8', 'firstbloodvictim': 'Int8',
+
+    # Damage
+    'damagetochampions': 'Int32', 'dpm': 'float32', 'damageshare': 'float32',
+    'damagetakenperminute': 'float32', 'damagemitigatedperminute': 'float32',
+
+    # Vision
+    'wardsplaced': 'Int16', 'wpm': 'float32', 'wardskilled': 'Int16',
+    'wcpm': 'float32', 'controlwardsbought': 'Int16', 'visionscore': 'Int16',
+    'vspm': 'float32',
+
+    # Gold and CS
+    'totalgold': 'Int32', 'earnedgold': 'Int32', 'earned gpm': 'float32',
+    'goldspent': 'Int32', 'gspd': 'float32', 'total cs': 'Int16',
+    'minionkills': 'Int16', 'monsterkills': 'Int16',
+    'monsterkillsownjungle': 'Int16', 'monsterkillsenemyjungle': 'Int16',
+    'cspm': 'float32',
+
+    # Early game (10 minute) snapshots
+    'goldat10': 'Int32', 'xpat10': 'Int32', 'csat10': 'Int16',
+    'opp_goldat10': 'Int32', 'opp_xpat10': 'Int32', 'opp_csat10': 'Int16',
+    'golddiffat10': 'Int32', 'xpdiffat10': 'Int32', 'csdiffat10': 'Int16',
+    'killsat10': 'Int16', 'assistsat10': 'Int16', 'deathsat10': 'Int16',
+    'opp_killsat10': 'Int16', 'opp_assistsat10': 'Int16',
+    'opp_deathsat10': 'Int16'
+}
 
 # Leaguepedia API settings (for future enrichment)
 LEAGUEPEDIA_API_URL = "https://lol.fandom.com/api.php"
@@ -7,17 +7,13 @@ the complete exploratory data analysis on 2025 LoL esports data.
 
 Usage:
     python run_eda.py
+    python -m src.eda_analysis
+    run-eda  (after pip install -e .)
 
 Returns:
     None: Executes the full EDA pipeline and saves results.
 """
 
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from src.eda_analysis import main
 
 if __name__ == "__main__":
@@ -9,21 +9,85 @@ Returns:
 """
 
 import os
+import re
 import sys
+import json
+import time
+import codecs
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import compute as pc
+from pyarrow import parquet as pq
 import requests
+from requests.adapters import HTTPAdapter
+from charset_normalizer import from_bytes
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import gdown
 
-# Add parent directory to path for config import
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.config import (
     RAW_DATA_DIR,
+    PROCESSED_DATA_DIR,
     ORACLE_ELIXIR_FILE_IDS,
-    CURRENT_YEAR
+    GOOGLE_DRIVE_DOWNLOAD_URL,
+    DRIVE_CONFIRMED_DOWNLOAD_URL,
+    DRIVE_TOKEN_TTL,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_TIMEOUT,
+    MAX_PARALLEL_DOWNLOADS,
+    PROGRESS_INTERVAL,
+    PREFETCH_WORKERS,
+    DOWNLOAD_SLICES,
+    MIN_SLICED_DOWNLOAD_SIZE,
+    CURRENT_YEAR,
+    CSV_BLOCK_SIZE,
+    ENCODING_SNIFF_BYTES,
+    FINGERPRINT_BYTES,
+    NA_VALUES,
+    COLUMN_DTYPES,
+    EXPECTED_COLUMNS,
+    EXPECTED_COLUMNS_ORDER
 )
 
+# Arrow equivalents of the pandas dtype names used in COLUMN_DTYPES
+ARROW_TYPES = {
+    'Int8': pa.int8(),
+    'Int16': pa.int16(),
+    'Int32': pa.int32(),
+    'float32': pa.float32(),
+    'category': pa.dictionary(pa.int32(), pa.string()),
+    'datetime64[ms]': pa.timestamp('ms')
+}
+
+# Arrow integers map to pandas nullable integers so missing values
+# do not force an upcast to float64 during conversion
+PANDAS_TYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype()
+}
+
+# Schema of the cached Parquet copies, built once so writes and reads do not
+# re-derive column types from the frame on every call. Columns without an
+# explicit dtype are free text.
+ARROW_SCHEMA = pa.schema([
+    (col, ARROW_TYPES[COLUMN_DTYPES[col]] if col in COLUMN_DTYPES else pa.string())
+    for col in EXPECTED_COLUMNS_ORDER
+])
+
+# Explicit Arrow parse types for every column, and the text-only subset that
+# can never fail conversion, used to re-parse files with stray numeric tokens
+STRICT_COLUMN_TYPES = dict(zip(ARROW_SCHEMA.names, ARROW_SCHEMA.types))
+TEXT_COLUMN_TYPES = {
+    col: arrow_type for col, arrow_type in STRICT_COLUMN_TYPES.items()
+    if pa.types.is_string(arrow_type) or pa.types.is_dictionary(arrow_type)
+}
+
 
 class DataLoader:
     """
@@ -36,25 +100,92 @@ class DataLoader:
         DataLoader: Instance with methods for data operations.
     """
 
-    def __init__(self, data_dir: str = RAW_DATA_DIR):
+    def __init__(self, data_dir: str = RAW_DATA_DIR, processed_dir: str = PROCESSED_DATA_DIR):
         """
-        Initialize the DataLoader with specified data directory.
+        Initialize the DataLoader with specified data directories.
 
         Args:
             data_dir (str): Directory path for storing raw data files.
+            processed_dir (str): Directory path for cached Parquet copies.
 
         Returns:
             None: Initializes the DataLoader instance.
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.processed_dir = Path(processed_dir)
+        self.processed_dir.mkdir(parents=True, exist_ok=True)
+
+        # One keep-alive session for all downloads, sized so every concurrent
+        # year and range slice can hold its own pooled connection
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=MAX_PARALLEL_DOWNLOADS * DOWNLOAD_SLICES)
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+
+        # Background workers for prefetching downloads (threads start on first use)
+        self._pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+
+        # Prefetches still running, by year, so a foreground download or load
+        # of the same year waits for it instead of writing the same file
+        self._prefetches: Dict[int, Future] = {}
+        self._prefetch_lock = threading.Lock()
+
+    def close(self) -> None:
+        """
+        Releases the loader's background workers and pooled HTTP connections.
+
+        Waits for any prefetch still in progress so no partial file is left behind.
+
+        Returns:
+            None: Shuts down the prefetch pool and closes the HTTP session.
+        """
+        self._pool.shutdown(wait=True)
+        self._http.close()
+
+    def __enter__(self) -> 'DataLoader':
+        """
+        Enters a context that closes the loader's HTTP session on exit.
+
+        Returns:
+            DataLoader: This loader instance.
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Closes the loader's HTTP session when leaving a ``with`` block.
+
+        Returns:
+            None: Closes the underlying HTTP session.
+        """
+        self.close()
 
     def download_year_data(self, year: int = CURRENT_YEAR, force_download: bool = False) -> str:
         """
         Downloads LoL esports data for a specific year from Google Drive.
 
-        This method uses the gdown library to download CSV files from Oracle's Elixir
-        Google Drive repository. It checks if the file already exists before downloading.
+        This method streams CSV files from Oracle's Elixir Google Drive repository
+        directly to disk, falling back to the gdown library when Drive requires a
+        confirmation step. It checks if the file already exists before downloading.
+
+        Args:
+            year (int): The year of data to download.
+            force_download (bool): If True, re-download even if file exists.
+
+        Returns:
+            str: Path to the downloaded CSV file.
+        """
+        # A running prefetch for this year is already writing the file
+        prefetched = self._wait_for_prefetch(year)
+        if prefetched and not force_download:
+            return prefetched
+
+        return self._download_year_data(year, force_download)
+
+    def _download_year_data(self, year: int, force_download: bool = False) -> str:
+        """
+        Downloads a year's data without checking for a running prefetch.
 
         Args:
             year (int): The year of data to download.
@@ -78,12 +209,37 @@ class DataLoader:
         try:
             print(f"Downloading {year} LoL esports data from Google Drive...")
 
-            # Construct Google Drive download URL
-            # Handle both file and folder IDs
-            url = f"https://drive.google.com/uc?id={file_id}"
-
-            # Use gdown to download the file
-            gdown.download(url, str(output_path), quiet=False, fuzzy=True)
+            # Stream straight to disk, reusing a cached confirmation token so
+            # large files skip Drive's virus-scan warning page
+            try:
+                token = self._load_drive_token(file_id)
+                if token:
+                    url = DRIVE_CONFIRMED_DOWNLOAD_URL.format(file_id=file_id, **token)
+                else:
+                    url = GOOGLE_DRIVE_DOWNLOAD_URL.format(file_id=file_id)
+
+                downloaded = self._stream_to_file(url, output_path)
+
+                if not downloaded:
+                    # Missing or expired token: resolve a fresh one from the warning page
+                    token = self._fetch_drive_token(file_id)
+                    if token:
+                        url = DRIVE_CONFIRMED_DOWNLOAD_URL.format(file_id=file_id, **token)
+                        downloaded = self._stream_to_file(url, output_path)
+
+            except (requests.RequestException, OSError) as e:
+                # Includes an incomplete range slice, raised as IOError
+                print(f"Direct download failed ({e}), falling back to gdown...")
+                output_path.with_name(output_path.name + '.part').unlink(missing_ok=True)
+                downloaded = False
+
+            if not downloaded:
+                # Drive returned its confirmation page or an error instead of
+                # the file, so let gdown handle the confirm flow. gdown skips
+                # existing outputs when resuming, so clear any stale copy first.
+                output_path.unlink(missing_ok=True)
+                url = f"https://drive.google.com/uc?id={file_id}"
+                gdown.download(url, str(output_path), quiet=False, fuzzy=True, resume=True)
 
             print(f"Successfully downloaded data to {output_path}")
             return str(output_path)
@@ -96,38 +252,360 @@ class DataLoader:
             print(f"3. Save it as: {output_path}")
             raise
 
-    def load_csv(self, file_path: str) -> pd.DataFrame:
+    def prefetch_year_data(self, year: int, force_download: bool = False) -> Future:
+        """
+        Starts downloading a year's data in the background.
+
+        Lets network I/O for the next season overlap with CPU-bound analysis of
+        the current one, e.g. prefetching 2024 while the 2025 EDA runs. Calling
+        ``result()`` on the returned future blocks only if the download has not
+        finished yet. While it runs, download_year_data and load_year_data for
+        the same year wait for it rather than starting a second transfer, and
+        further prefetches of that year return the same future.
+
+        Args:
+            year (int): The year of data to download.
+            force_download (bool): If True, re-download even if file exists.
+
+        Returns:
+            Future: Resolves to the downloaded CSV file path.
+        """
+        with self._prefetch_lock:
+            future = self._prefetches.get(year)
+            if future is not None:
+                return future
+            future = self._pool.submit(self._download_year_data, year, force_download)
+            self._prefetches[year] = future
+
+        # Registered outside the lock: the callback runs immediately if the
+        # download has already finished, and it takes the lock itself
+        future.add_done_callback(lambda done: self._forget_prefetch(year, done))
+        return future
+
+    def _forget_prefetch(self, year: int, future: Future) -> None:
+        """
+        Drops a finished prefetch from the in-flight map.
+
+        Args:
+            year (int): The year that was prefetched.
+            future (Future): The finished prefetch.
+
+        Returns:
+            None: Removes the entry if it still refers to this future.
+        """
+        with self._prefetch_lock:
+            if self._prefetches.get(year) is future:
+                del self._prefetches[year]
+
+    def _wait_for_prefetch(self, year: int) -> Optional[str]:
+        """
+        Blocks until any running prefetch of a year has finished.
+
+        Args:
+            year (int): The year to check.
+
+        Returns:
+            Optional[str]: The prefetched CSV path, or None if no prefetch was
+                running or it failed (its error was already reported).
+        """
+        with self._prefetch_lock:
+            future = self._prefetches.get(year)
+        if future is None:
+            return None
+
+        print(f"Waiting for background download of {year} data...")
+        wait([future])
+        return future.result() if future.exception() is None else None
+
+    def download_years(self, years: List[int], force_download: bool = False) -> Dict[int, str]:
+        """
+        Downloads several years of LoL esports data concurrently.
+
+        Each year is fetched by download_year_data on a worker thread, so the
+        network transfers overlap instead of running back to back.
+
+        Args:
+            years (List[int]): The years of data to download.
+            force_download (bool): If True, re-download even if files exist.
+
+        Returns:
+            Dict[int, str]: Mapping of year to the downloaded CSV file path.
+        """
+        max_workers = max(1, min(MAX_PARALLEL_DOWNLOADS, len(years)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                year: pool.submit(self.download_year_data, year, force_download)
+                for year in years
+            }
+            return {year: future.result() for year, future in futures.items()}
+
+    def _load_drive_token(self, file_id: str) -> Optional[Dict[str, str]]:
+        """
+        Loads a cached Google Drive download confirmation token.
+
+        Args:
+            file_id (str): Google Drive file ID the token was issued for.
+
+        Returns:
+            Optional[Dict[str, str]]: The ``confirm`` and ``uuid`` values, or
+                None if no token is cached or it is older than DRIVE_TOKEN_TTL.
+        """
+        token_path = self.data_dir / f".gdown_token_{file_id}.json"
+
+        try:
+            if time.time() - token_path.stat().st_mtime > DRIVE_TOKEN_TTL:
+                return None
+            with open(token_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _fetch_drive_token(self, file_id: str) -> Optional[Dict[str, str]]:
+        """
+        Resolves and caches the confirmation token for a large Drive file.
+
+        Google Drive answers downloads of files it cannot virus-scan with an
+        HTML form whose hidden ``confirm`` and ``uuid`` fields authorise the
+        real download. The values are cached on disk so later downloads can
+        request the file directly.
+
+        Args:
+            file_id (str): Google Drive file ID to resolve.
+
+        Returns:
+            Optional[Dict[str, str]]: The ``confirm`` and ``uuid`` values, or
+                None if the response did not contain a confirmation form.
+        """
+        url = GOOGLE_DRIVE_DOWNLOAD_URL.format(file_id=file_id)
+        response = self._http.get(url, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+
+        fields = dict(re.findall(r'name="(confirm|uuid)" value="([^"]*)"', response.text))
+        if 'confirm' not in fields:
+            return None
+
+        token = {'confirm': fields['confirm'], 'uuid': fields.get('uuid', '')}
+        with open(self.data_dir / f".gdown_token_{file_id}.json", 'w') as f:
+            json.dump(token, f)
+
+        return token
+
+    def _stream_to_file(self, url: str, output_path: Path) -> bool:
+        """
+        Streams a file download to disk without buffering it in memory.
+
+        Large files served with byte-range support are fetched as several
+        concurrent slices; anything else is copied as a single stream. Data is
+        written to a temporary ``.part`` file which replaces ``output_path``
+        only once the transfer completes, so an interrupted download never
+        looks like a finished one.
+
+        Args:
+            url (str): Direct download URL.
+            output_path (Path): Destination file path.
+
+        Returns:
+            bool: True if the file was written, False if the server answered
+                with an HTML page (e.g. Google Drive's virus-scan warning).
+        """
+        head = self._http.head(url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+
+        # Not every endpoint answers HEAD; without a usable probe the file is
+        # fetched as a single GET, whose own status is checked below
+        if head.ok and head.headers.get('Content-Type', '').startswith('text/html'):
+            return False
+
+        part_path = output_path.with_name(output_path.name + '.part')
+        size = int(head.headers.get('Content-Length', 0))
+        sliceable = (
+            head.ok and
+            head.headers.get('Accept-Ranges') == 'bytes' and
+            size >= MIN_SLICED_DOWNLOAD_SIZE and
+            hasattr(os, 'pwrite')
+        )
+
+        # Fall back to one stream if the server ignores the Range header
+        if not (sliceable and self._download_slices(head.url, part_path, size)):
+            with self._http.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+
+                if response.headers.get('Content-Type', '').startswith('text/html'):
+                    return False
+
+                total_size = int(response.headers.get('Content-Length', 0))
+                downloaded = 0
+                last_report = 0.0
+
+                with open(part_path, 'wb') as f:
+                    # Decode any transfer compression so the CSV lands as plain text
+                    response.raw.decode_content = True
+                    for chunk in iter(lambda: response.raw.read(DOWNLOAD_CHUNK_SIZE), b''):
+                        f.write(chunk)
+                        downloaded += len(chunk)
+
+                        # Redraw the progress line at most every PROGRESS_INTERVAL seconds
+                        now = time.monotonic()
+                        if total_size and (now - last_report >= PROGRESS_INTERVAL or
+                                           downloaded >= total_size):
+                            percent = min(100.0, downloaded * 100.0 / total_size)
+                            sys.stderr.write('\rDownloading: %.1f%%' % percent)
+                            sys.stderr.flush()
+                            last_report = now
+
+                if total_size:
+                    sys.stderr.write('\n')
+
+        part_path.replace(output_path)
+
+        return True
+
+    def _download_slices(self, url: str, part_path: Path, size: int) -> bool:
+        """
+        Downloads a file as concurrent byte-range slices into one file.
+
+        The target is pre-sized and each worker writes its slice at the matching
+        offset with ``os.pwrite``, so no reassembly step is needed.
+
+        Args:
+            url (str): Download URL that supports HTTP range requests.
+            part_path (Path): Temporary file to write the slices into.
+            size (int): Total file size in bytes.
+
+        Returns:
+            bool: True if every slice was written, False if the server
+                answered a range request with the full body instead.
+        """
+        ranges = [
+            (i * size // DOWNLOAD_SLICES, (i + 1) * size // DOWNLOAD_SLICES - 1)
+            for i in range(DOWNLOAD_SLICES)
+        ]
+
+        def fetch_slice(fd: int, start: int, end: int) -> bool:
+            headers = {'Range': f"bytes={start}-{end}"}
+            with self._http.get(url, headers=headers, stream=True,
+                                timeout=DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    return False
+
+                offset = start
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+
+            if offset != end + 1:
+                raise IOError(f"Incomplete slice bytes={start}-{end}: got {offset - start} bytes")
+            return True
+
+        with open(part_path, 'wb') as f:
+            f.truncate(size)
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_SLICES) as pool:
+                futures = [pool.submit(fetch_slice, f.fileno(), start, end)
+                           for start, end in ranges]
+                return all(future.result() for future in futures)
+
+    @staticmethod
+    def _detect_encoding(file_path: str) -> str:
+        """
+        Detects the text encoding of a file from a sample of its first bytes.
+
+        Files that decode cleanly as UTF-8 (with or without a BOM) are reported
+        as UTF-8 without further analysis; otherwise charset-normalizer guesses
+        the encoding from the sample.
+
+        Args:
+            file_path (str): Path to the file to inspect.
+
+        Returns:
+            str: Python codec name for the detected encoding.
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(ENCODING_SNIFF_BYTES)
+
+        try:
+            # Incremental decoding tolerates a multi-byte character cut off at the end
+            codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            best = from_bytes(head).best()
+            return best.encoding if best is not None else 'latin-1'
+
+    @staticmethod
+    def load_csv(file_path: str, usecols: Optional[List[str]] = None,
+                 row_filter: Optional[pc.Expression] = None) -> pd.DataFrame:
         """
         Loads a CSV file into a pandas DataFrame with error handling.
 
         This method reads CSV files with proper encoding and data type inference,
-        handling common issues like mixed types and missing values.
+        handling common issues like mixed types and missing values. Only the
+        requested columns are converted; the rest are skipped by the parser.
+        As a static method it can be called as ``DataLoader.load_csv(...)``
+        without setting up directories or download connections.
 
         Args:
             file_path (str): Path to the CSV file to load.
+            usecols (Optional[List[str]]): Columns to load. Defaults to
+                EXPECTED_COLUMNS_ORDER; columns absent from the file are filled with nulls.
+            row_filter (Optional[pc.Expression]): Arrow predicate applied before
+                conversion, so rejected rows never reach pandas.
 
         Returns:
             pd.DataFrame: Loaded data as a pandas DataFrame.
         """
+        if usecols is None:
+            usecols = list(EXPECTED_COLUMNS_ORDER)
+
         try:
             print(f"Loading data from {file_path}...")
 
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'iso-8859-1']
+            # Arrow parses the file in parallel blocks and hands numeric
+            # columns to pandas without an intermediate Python object pass.
+            # The encoding is sniffed from the file head so normally only one
+            # parse runs; latin-1 remains as a fallback if later bytes disagree.
+            encodings = list(dict.fromkeys([DataLoader._detect_encoding(file_path), 'latin-1']))
 
             for encoding in encodings:
+                coerce = False
                 try:
-                    df = pd.read_csv(
-                        file_path,
-                        encoding=encoding,
-                        low_memory=False,
-                        na_values=['', 'NA', 'N/A', 'null', 'NULL']
-                    )
-                    print(f"Successfully loaded {len(df)} rows with encoding: {encoding}")
-                    return df
-                except UnicodeDecodeError:
+                    table = DataLoader._read_arrow_csv(file_path, encoding, usecols, STRICT_COLUMN_TYPES)
+                except pa.ArrowInvalid as e:
+                    # Invalid UTF-8 surfaces as a conversion error; latin-1
+                    # decodes any byte sequence so it is the last resort
+                    if 'UTF8' in str(e) or 'UTF-8' in str(e):
+                        continue
+                    if 'conversion error' not in str(e):
+                        raise
+
+                    # A stray token (e.g. '1.0' in an integer column) rejects the
+                    # strict types; infer numeric and date columns instead and
+                    # coerce them to their configured dtypes after conversion
+                    print(f"Warning: {e}; re-parsing with inferred column types")
+                    try:
+                        table = DataLoader._read_arrow_csv(file_path, encoding, usecols, TEXT_COLUMN_TYPES)
+                    except pa.ArrowInvalid as e:
+                        if 'UTF8' in str(e) or 'UTF-8' in str(e):
+                            continue
+                        raise
+                    coerce = True
+
+                # Undecodable text columns are inferred as binary rather than failing
+                if any(pa.types.is_binary(field.type) for field in table.schema):
                     continue
 
+                if row_filter is not None:
+                    table = table.filter(row_filter)
+
+                df = table.to_pandas(
+                    split_blocks=True,
+                    self_destruct=True,
+                    types_mapper=PANDAS_TYPES.get
+                )
+                if coerce:
+                    df = DataLoader._coerce_dtypes(df)
+                print(f"Successfully loaded {len(df)} rows with encoding: {encoding}")
+                return df
+
             raise ValueError(f"Could not read file with any of these encodings: {encodings}")
 
         except FileNotFoundError:
@@ -135,12 +613,140 @@ class DataLoader:
         except Exception as e:
             raise Exception(f"Error loading CSV: {e}")
 
+    @staticmethod
+    def _read_arrow_csv(file_path: str, encoding: str, usecols: List[str],
+                        column_types: Dict[str, pa.DataType]) -> pa.Table:
+        """
+        Parses a CSV file into an Arrow table.
+
+        Args:
+            file_path (str): Path to the CSV file.
+            encoding (str): Text encoding of the file.
+            usecols (List[str]): Columns to load; absent ones are filled with nulls.
+            column_types (Dict[str, pa.DataType]): Explicit Arrow types by column.
+
+        Returns:
+            pa.Table: The parsed table.
+        """
+        # Read from a memory map so Arrow parses the page cache
+        # directly instead of copying the file into its own buffers
+        with pa.memory_map(str(file_path), 'r') as source:
+            return pacsv.read_csv(
+                source,
+                read_options=pacsv.ReadOptions(
+                    block_size=CSV_BLOCK_SIZE,
+                    use_threads=True,
+                    encoding=encoding
+                ),
+                parse_options=pacsv.ParseOptions(delimiter=','),
+                convert_options=pacsv.ConvertOptions(
+                    null_values=NA_VALUES,
+                    strings_can_be_null=True,
+                    include_columns=usecols,
+                    include_missing_columns=True,
+                    column_types=column_types
+                )
+            )
+
+    @staticmethod
+    def _coerce_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Casts inferred numeric and date columns to their COLUMN_DTYPES types.
+
+        Values that cannot be represented in the target type (unparseable
+        tokens, fractions or out-of-range numbers in integer columns) become
+        missing rather than failing the load.
+
+        Args:
+            df (pd.DataFrame): Frame parsed without strict numeric types.
+
+        Returns:
+            pd.DataFrame: The frame with configured dtypes restored.
+        """
+        for col, dtype in COLUMN_DTYPES.items():
+            if col not in df.columns or col in TEXT_COLUMN_TYPES:
+                continue
+
+            series = df[col]
+            if dtype.startswith('datetime'):
+                coerced = pd.to_datetime(series, errors='coerce').astype(dtype)
+            else:
+                values = pd.to_numeric(series, errors='coerce').astype(np.float64)
+                target = pd.api.types.pandas_dtype(dtype)
+                if isinstance(target, pd.api.extensions.ExtensionDtype):
+                    info = np.iinfo(target.numpy_dtype)
+                    valid = (values == np.round(values)) & values.between(info.min, info.max)
+                    values = values.where(valid)
+                coerced = values.astype(target)
+
+            dropped = int(coerced.isna().sum() - series.isna().sum())
+            if dropped:
+                print(f"Warning: {dropped} invalid values in '{col}' set to missing")
+            df[col] = coerced
+
+        return df
+
+    @staticmethod
+    def file_fingerprint(file_path: Path,
+                         stat: Optional[os.stat_result] = None) -> Dict[str, object]:
+        """
+        Computes a cheap identity fingerprint for a data file.
+
+        Combines the file size and nanosecond modification time with a 64-bit
+        hash of the first and last few kilobytes, so a replaced file is detected
+        even when tools like rsync or git restore an older modification time.
+
+        Args:
+            file_path (Path): The file to fingerprint.
+            stat (Optional[os.stat_result]): An existing stat of the file, to
+                avoid repeating the syscall.
+
+        Returns:
+            Dict[str, object]: JSON-serialisable size, mtime and hash values.
+        """
+        file_path = Path(file_path)
+        if stat is None:
+            stat = file_path.stat()
+
+        with open(file_path, 'rb') as f:
+            head = f.read(FINGERPRINT_BYTES)
+            f.seek(max(stat.st_size - FINGERPRINT_BYTES, 0))
+            tail = f.read(FINGERPRINT_BYTES)
+
+        return {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': hashlib.blake2b(head + tail, digest_size=8).hexdigest()
+        }
+
+    def year_source(self, year: int = CURRENT_YEAR) -> Dict[str, object]:
+        """
+        Describes how load_year_data reads a year's CSV.
+
+        The result is the exact set of load_csv arguments load_year_data uses,
+        so callers can pass it on (e.g. to EsportsEDA) as the frame's provenance.
+
+        Args:
+            year (int): The year of data.
+
+        Returns:
+            Dict[str, object]: ``file_path``, ``usecols`` and ``row_filter``
+                keyword arguments for load_csv.
+        """
+        return {
+            'file_path': self.data_dir / f"lol_esports_{year}.csv",
+            'usecols': list(EXPECTED_COLUMNS_ORDER),
+            'row_filter': None
+        }
+
     def load_year_data(self, year: int = CURRENT_YEAR, download_if_missing: bool = True) -> pd.DataFrame:
         """
         Loads LoL esports data for a specific year, downloading if necessary.
 
         This is a convenience method that combines download and load operations,
-        automatically downloading the data if it's not found locally.
+        automatically downloading the data if it's not found locally. The parsed
+        data is cached as Parquet in the processed directory and reused until
+        the CSV's size, modification time, or head/tail contents change.
 
         Args:
             year (int): The year of data to load.
@@ -149,19 +755,68 @@ class DataLoader:
         Returns:
             pd.DataFrame: Complete dataset for the specified year.
         """
-        file_path = self.data_dir / f"lol_esports_{year}.csv"
+        source = self.year_source(year)
+        file_path = source['file_path']
+
+        # Never read a file a background prefetch is still replacing
+        self._wait_for_prefetch(year)
+
+        # A single stat serves the existence check and the cache fingerprint
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            stat = None
 
         # Download if file doesn't exist and download is enabled
-        if not file_path.exists() and download_if_missing:
+        if stat is None and download_if_missing:
             print(f"Data file for {year} not found locally.")
-            file_path = self.download_year_data(year)
-        elif not file_path.exists():
+            file_path = Path(self.download_year_data(year))
+            stat = file_path.stat()
+        elif stat is None:
             raise FileNotFoundError(
                 f"Data file for {year} not found at {file_path}. "
                 f"Set download_if_missing=True to download automatically."
             )
 
-        return self.load_csv(str(file_path))
+        # Reuse the Parquet copy while the CSV still matches the fingerprint
+        # recorded alongside it when the cache was written
+        parquet_path = self.processed_dir / f"lol_esports_{year}.parquet"
+        meta_path = parquet_path.with_suffix('.meta.json')
+        fingerprint = self.file_fingerprint(file_path, stat)
+
+        try:
+            with open(meta_path) as f:
+                cache_valid = json.load(f) == fingerprint and parquet_path.exists()
+        except (FileNotFoundError, ValueError):
+            cache_valid = False
+
+        if cache_valid:
+            print(f"Loading cached data from {parquet_path}...")
+            try:
+                table = pq.read_table(parquet_path, schema=ARROW_SCHEMA)
+                return table.to_pandas(split_blocks=True, self_destruct=True,
+                                       types_mapper=PANDAS_TYPES.get)
+            except pa.ArrowException as e:
+                # Caches written with a different schema are rebuilt from the CSV
+                print(f"Cached data is outdated ({e}), re-parsing CSV...")
+
+        df = self.load_csv(**source)
+
+        # Caching is best-effort: the parsed frame is returned even if the copy
+        # cannot be written. The stale sidecar is removed first and rewritten
+        # only after the Parquet file, so a partial write is never trusted.
+        try:
+            meta_path.unlink(missing_ok=True)
+            table = pa.Table.from_pandas(df, schema=ARROW_SCHEMA, preserve_index=False)
+            pq.write_table(table, parquet_path, compression='zstd', compression_level=3)
+            with open(meta_path, 'w') as f:
+                json.dump(fingerprint, f)
+        except (OSError, pa.ArrowException) as e:
+            print(f"Warning: could not cache parsed data ({e})")
+            return df
+        print(f"Cached parsed data to {parquet_path}")
+
+        return df
 
     def get_data_info(self, df: pd.DataFrame) -> dict:
         """
@@ -176,18 +831,90 @@ class DataLoader:
         Returns:
             dict: Dictionary containing dataset metadata and statistics.
         """
+        # Extension arrays (categorical, nullable, Arrow-backed) report their exact
+        # size without a scan; only object columns need a deep walk over strings
+        memory = df.memory_usage(deep=False)
+        for col in df.select_dtypes(include=['object']).columns:
+            memory[col] = df[col].memory_usage(deep=True, index=False)
+
         info = {
             'shape': df.shape,
             'columns': list(df.columns),
             'dtypes': df.dtypes.to_dict(),
-            'missing_values': df.isnull().sum().to_dict(),
-            'memory_usage': df.memory_usage(deep=True).sum() / 1024**2,  # MB
+            'missing_values': (len(df) - df.count()).to_dict(),
+            'memory_usage': memory.sum() / 1024**2,  # MB
             'numeric_columns': list(df.select_dtypes(include=['number']).columns),
-            'categorical_columns': list(df.select_dtypes(include=['object']).columns)
+            'categorical_columns': list(df.select_dtypes(include=['object', 'category', 'string']).columns)
         }
 
         return info
 
+    def validate(self, df: pd.DataFrame) -> dict:
+        """
+        Runs basic integrity checks on a loaded dataset.
+
+        Compares the columns against EXPECTED_COLUMNS and counts rows with
+        negative kills, deaths or assists. The row check is a vectorized NumPy
+        comparison over whole columns rather than a per-row loop.
+
+        Args:
+            df (pd.DataFrame): The dataset to validate.
+
+        Returns:
+            dict: Missing and unexpected column names, and the number of rows
+                with invalid combat statistics.
+        """
+        present = set(df.columns)
+
+        invalid = np.zeros(len(df), dtype=bool)
+        for col in ('kills', 'deaths', 'assists'):
+            if col in present:
+                invalid |= df[col].to_numpy(dtype=np.float64, na_value=np.nan) < 0
+
+        report = {
+            'missing_columns': [col for col in EXPECTED_COLUMNS_ORDER if col not in present],
+            'unexpected_columns': [col for col in df.columns if col not in EXPECTED_COLUMNS],
+            'invalid_stat_rows': int(np.count_nonzero(invalid))
+        }
+
+        if report['missing_columns']:
+            print(f"Warning: missing expected columns: {report['missing_columns']}")
+        if report['invalid_stat_rows']:
+            print(f"Warning: {report['invalid_stat_rows']} rows have negative kills, deaths or assists")
+
+        return report
+
+    def to_soa(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Splits the numeric columns of a DataFrame into contiguous NumPy arrays.
+
+        Returns one structure-of-arrays view of the data so vectorized per-column
+        reductions (e.g. ``np.bincount`` on group codes) can run on plain arrays
+        without going through pandas. Nullable integer columns keep their NumPy
+        integer dtype when complete and become float64 with NaN otherwise.
+
+        Args:
+            df (pd.DataFrame): The dataset to convert.
+
+        Returns:
+            Dict[str, np.ndarray]: Mapping of column name to a 1-D array.
+        """
+        arrays = {}
+
+        for col in df.select_dtypes(include=['number']).columns:
+            series = df[col]
+
+            if not isinstance(series.dtype, np.dtype) and series.hasnans:
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            elif not isinstance(series.dtype, np.dtype):
+                values = series.to_numpy(dtype=series.dtype.numpy_dtype)
+            else:
+                values = series.to_numpy(copy=False)
+
+            arrays[col] = np.ascontiguousarray(values)
+
+        return arrays
+
 
 def main():
     """
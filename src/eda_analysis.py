@@ -14,29 +14,70 @@ Returns:
     Analysis: Complete EDA results with visualizations and insights.
 """
 
-import os
-import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 from pathlib import Path
 from typing import Tuple, List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+import json
 import warnings
+import pyarrow as pa
+from pyarrow import compute as pc
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
 
 warnings.filterwarnings('ignore')
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.config import (
     FIGURES_DIR,
     FIGURE_SIZE,
     DPI,
     STYLE,
     MIN_GAMES_THRESHOLD,
-    PROCESSED_DATA_DIR
+    PROCESSED_DATA_DIR,
+    EDA_COLUMNS,
+    ANALYSIS_WORKERS,
+    CLEAN_CACHE_VERSION
 )
-from src.data_loader import DataLoader
+from src.data_loader import DataLoader, PANDAS_TYPES
+from src.fast_groupby import group_sum_count
+
+try:
+    import numexpr
+except ImportError:  # Optional; _safe_ratio falls back to NumPy
+    numexpr = None
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray,
+                scale: float = 1.0) -> np.ndarray:
+    """
+    Divides two arrays, treating a zero denominator as one.
+
+    Uses numexpr when it is installed, so the comparison, substitution,
+    division and scaling run as one fused, multi-threaded pass; otherwise
+    the NumPy version reuses a single output buffer.
+
+    Args:
+        numerator (np.ndarray): Float64 numerator values.
+        denominator (np.ndarray): Float64 denominator values.
+        scale (float): Factor applied to the result.
+
+    Returns:
+        np.ndarray: numerator / denominator * scale.
+    """
+    if numexpr is not None:
+        return numexpr.evaluate(
+            'numerator / where(denominator == 0, 1, denominator) * scale'
+        )
+
+    result = np.where(denominator == 0, 1.0, denominator)
+    np.divide(numerator, result, out=result)
+    if scale != 1.0:
+        result *= scale
+    return result
 
 
 class EsportsEDA:
@@ -50,21 +91,41 @@ class EsportsEDA:
         EsportsEDA: Instance with analysis and visualization methods.
     """
 
-    def __init__(self, df: pd.DataFrame, output_dir: str = FIGURES_DIR):
+    def __init__(self, df: pd.DataFrame, output_dir: str = FIGURES_DIR,
+                 source: Optional[Dict[str, object]] = None):
         """
         Initialize EDA analyzer with dataset and output configuration.
 
         Args:
             df (pd.DataFrame): The esports dataset to analyze.
             output_dir (str): Directory path for saving visualization outputs.
+            source (Optional[Dict[str, object]]): The load_csv arguments df was
+                read with, as returned by DataLoader.year_source. When given,
+                clean_data caches its result keyed on them; it must describe
+                df exactly, so omit it for filtered or modified frames.
 
         Returns:
             None: Initializes the EsportsEDA instance.
         """
-        self.df = df.copy()
+        self.df = df
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Aggregate tables and GroupBy objects shared between analyses,
+        # reset by clean_data
+        self._stats_cache: Dict[str, pd.DataFrame] = {}
+        self._groupers: Dict[Tuple[str, ...], pd.core.groupby.DataFrameGroupBy] = {}
+
+        # How df was read from disk, in JSON-serialisable form for the cache key
+        self._source: Optional[Dict[str, object]] = None
+        if source is not None:
+            row_filter = source.get('row_filter')
+            self._source = {
+                'path': Path(source['file_path']),
+                'usecols': [str(col) for col in source['usecols']],
+                'row_filter': str(row_filter) if row_filter is not None else None
+            }
+
         # Set visualization style
         try:
             plt.style.use(STYLE)
@@ -73,64 +134,326 @@ class EsportsEDA:
 
         sns.set_palette("husl")
 
+        # One figure is cleared and reused by every visualization instead of
+        # creating and tearing down a pyplot figure per chart. Constrained
+        # layout fits the axes while saving, with no separate tight_layout pass.
+        self._fig = Figure(figsize=FIGURE_SIZE, layout='constrained')
+
         # Initialize processed data directory
         self.processed_dir = Path(PROCESSED_DATA_DIR)
         self.processed_dir.mkdir(parents=True, exist_ok=True)
 
+    @classmethod
+    def from_csv(cls, file_path: str, output_dir: str = FIGURES_DIR) -> 'EsportsEDA':
+        """
+        Builds an analyzer straight from a CSV, reading only what the EDA uses.
+
+        Only EDA_COLUMNS are parsed, and team summary rows and rows missing a
+        player, position or champion are dropped on the Arrow table before
+        conversion to pandas. Missing-data analysis then covers just those
+        columns and player rows.
+
+        Args:
+            file_path (str): Path to the Oracle's Elixir CSV file.
+            output_dir (str): Directory path for saving visualization outputs.
+
+        Returns:
+            EsportsEDA: Analyzer over the player rows of the file.
+        """
+        player_rows = (
+            pc.field('position').is_valid()
+            & (pc.field('position') != 'team')
+            & pc.field('playerid').is_valid()
+            & pc.field('champion').is_valid()
+        )
+        source = {'file_path': file_path, 'usecols': list(EDA_COLUMNS), 'row_filter': player_rows}
+        df = DataLoader.load_csv(**source)
+        return cls(df, output_dir=output_dir, source=source)
+
+    @staticmethod
+    def _top_k(values: np.ndarray, k: int) -> np.ndarray:
+        """
+        Finds the positions of the k largest values without a full sort.
+
+        Args:
+            values (np.ndarray): Values to rank; NaNs rank last.
+            k (int): Number of positions to return.
+
+        Returns:
+            np.ndarray: Positions of the k largest values, largest first.
+        """
+        k = min(k, len(values))
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+
+        # argpartition selects the top k in linear time; only those k are sorted
+        top = np.argpartition(-values, k - 1)[:k]
+        return top[np.argsort(-values[top], kind='stable')]
+
+    @staticmethod
+    def _write_csv(df: pd.DataFrame, output_path: Path, index: bool = False) -> None:
+        """
+        Writes a result table to CSV with Arrow's multi-threaded writer.
+
+        Args:
+            df (pd.DataFrame): Table to write.
+            output_path (Path): Destination CSV path.
+            index (bool): Whether to write the index as an unnamed first column.
+
+        Returns:
+            None: Writes the CSV file.
+        """
+        if index:
+            df = df.reset_index(names='')
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_path)
+
+    def _new_axes(self, nrows: int = 1, ncols: int = 1,
+                  figsize: Tuple[float, float] = FIGURE_SIZE):
+        """
+        Clears the shared figure and lays out a fresh grid of axes on it.
+
+        Args:
+            nrows (int): Number of subplot rows.
+            ncols (int): Number of subplot columns.
+            figsize (Tuple[float, float]): Figure size in inches.
+
+        Returns:
+            Axes or np.ndarray: A single Axes, or an array of Axes for grids.
+        """
+        self._fig.clf()
+        self._fig.set_size_inches(figsize)
+        return self._fig.subplots(nrows, ncols)
+
+    def _save_figure(self, save_path: Path) -> None:
+        """
+        Renders the shared figure to an image file.
+
+        Agg draws long paths in chunks only while this figure is saved, so
+        global matplotlib settings for other figures are left untouched.
+
+        Args:
+            save_path (Path): Destination image path.
+
+        Returns:
+            None: Writes the image file.
+        """
+        with plt.rc_context({'agg.path.chunksize': 10000}):
+            self._fig.savefig(save_path, dpi=DPI)
+
     def clean_data(self) -> pd.DataFrame:
         """
         Performs data cleaning and preprocessing operations.
 
         This method handles missing values, converts data types, creates derived
-        features, and filters out incomplete or invalid records.
+        features, and filters out incomplete or invalid records. When the
+        analyzer was given its source (as from_csv and main do), the cleaned
+        frame is cached as Parquet in the processed directory and reused until
+        the source CSV or the way it was loaded changes.
+
+        Returns:
+            pd.DataFrame: Cleaned and preprocessed dataset.
+        """
+        df = self._load_clean_cache()
+
+        if df is None:
+            print("Cleaning and preprocessing data...")
+            df = self._clean(self.df)
+            self._save_clean_cache(df)
+
+        print(f"Data cleaned: {len(df)} rows remaining")
+
+        self.df_clean = df
+        self._n_games = df['gameid'].nunique() if 'gameid' in df.columns else 0
+        self._stats_cache = {}
+        self._groupers = {}
+        return df
+
+    def _clean_cache_paths(self) -> Tuple[Path, Path]:
+        """
+        Returns the Parquet and metadata paths of the cleaned-data cache.
+
+        Returns:
+            Tuple[Path, Path]: Cached frame path and its fingerprint sidecar.
+        """
+        parquet_path = self.processed_dir / f"{self._source['path'].stem}_clean.parquet"
+        return parquet_path, parquet_path.with_suffix('.meta.json')
+
+    def _clean_cache_key(self) -> Dict[str, object]:
+        """
+        Identifies the cleaned frame by its source file, how it was loaded
+        (from_csv reads a subset of columns and rows), the number of raw rows
+        and the cleaning version.
+
+        Returns:
+            Dict[str, object]: JSON-serialisable cache key.
+        """
+        return {
+            'source': DataLoader.file_fingerprint(self._source['path']),
+            'usecols': self._source['usecols'],
+            'row_filter': self._source['row_filter'],
+            'rows': len(self.df),
+            'version': CLEAN_CACHE_VERSION
+        }
+
+    def _load_clean_cache(self) -> Optional[pd.DataFrame]:
+        """
+        Loads the cached cleaned frame if it matches the current source file.
+
+        Returns:
+            Optional[pd.DataFrame]: Cleaned dataset, or None when the load is
+                not recorded or the cache is missing or stale.
+        """
+        if self._source is None or not self._source['path'].exists():
+            return None
+
+        parquet_path, meta_path = self._clean_cache_paths()
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get('key') != self._clean_cache_key():
+                return None
+            table = pq.read_table(parquet_path)
+        except (FileNotFoundError, ValueError, AttributeError, pa.ArrowException):
+            return None
+
+        print(f"Loading cleaned data from {parquet_path}...")
+        df = table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=PANDAS_TYPES.get)
+
+        # Parquet cannot express every pandas dtype (an all-null categorical
+        # reads back as float64), so restore any column that did not round-trip
+        for col, dtype in meta['dtypes'].items():
+            if str(df[col].dtype) != dtype:
+                df[col] = df[col].astype(dtype)
+        return df
+
+    def _save_clean_cache(self, df: pd.DataFrame) -> None:
+        """
+        Writes the cleaned frame and its cache key to the processed directory.
+
+        Caching is best-effort: a failed write is reported and the analysis
+        continues with the frame already in memory. The sidecar is written only
+        after the Parquet file, so a partial write is never treated as valid.
+
+        Args:
+            df (pd.DataFrame): Cleaned dataset to cache.
+
+        Returns:
+            None: Writes the Parquet file and metadata sidecar.
+        """
+        if self._source is None or not self._source['path'].exists():
+            return
+
+        parquet_path, meta_path = self._clean_cache_paths()
+        try:
+            meta_path.unlink(missing_ok=True)
+            table = pa.Table.from_pandas(df)
+            pq.write_table(table, parquet_path, compression='zstd', compression_level=3)
+            meta = {
+                'key': self._clean_cache_key(),
+                'dtypes': {str(col): str(dtype) for col, dtype in df.dtypes.items()}
+            }
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+        except (OSError, pa.ArrowException) as e:
+            print(f"Warning: could not cache cleaned data ({e})")
+            return
+        print(f"Cached cleaned data to {parquet_path}")
+
+    def _clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Filters, converts and derives features on a raw dataset.
+
+        Args:
+            df (pd.DataFrame): Raw esports dataset.
 
         Returns:
             pd.DataFrame: Cleaned and preprocessed dataset.
         """
-        print("Cleaning and preprocessing data...")
 
-        df = self.df.copy()
+        # Filter player rows only (exclude team summary rows). Filtering first
+        # means the conversions below only touch the rows that are kept.
+        if 'position' in df.columns:
+            df = df[df['position'].notna() & (df['position'] != 'team')]
+
+        # Remove rows with critical missing values. dropna returns a new frame,
+        # so the column assignments below never write through to self.df.
+        critical_cols = ['playerid', 'position', 'champion']
+        df = df.dropna(subset=[col for col in critical_cols if col in df.columns])
+
+        # Drop categories left empty by the row filters (e.g. the 'team' position)
+        for col in df.select_dtypes(include=['category']).columns:
+            df[col] = df[col].cat.remove_unused_categories()
 
         # Convert date to datetime
         if 'date' in df.columns:
             df['date'] = pd.to_datetime(df['date'], errors='coerce')
 
-        # Convert numeric columns
+        # Convert numeric columns as one block. DataLoader already parses these
+        # into numeric dtypes, so only columns that arrived as text are coerced.
         numeric_cols = [
             'kills', 'deaths', 'assists', 'gamelength', 'totalgold',
             'damagetochampions', 'dpm', 'earnedgold', 'earned gpm',
             'total cs', 'cspm', 'visionscore', 'vspm', 'result'
         ]
+        to_convert = [
+            col for col in numeric_cols
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col].dtype)
+        ]
+        if to_convert:
+            df[to_convert] = df[to_convert].apply(pd.to_numeric, errors='coerce')
 
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-
-        # Create derived metrics
+        # Create derived metrics on the raw arrays, avoiding the temporary
+        # Series that pandas arithmetic and replace() would allocate
         if 'kills' in df.columns and 'deaths' in df.columns and 'assists' in df.columns:
+            kills = df['kills'].to_numpy(dtype=np.float64, na_value=np.nan)
+            deaths = df['deaths'].to_numpy(dtype=np.float64, na_value=np.nan)
+            assists = df['assists'].to_numpy(dtype=np.float64, na_value=np.nan)
+            takedowns = kills + assists
+
             # KDA calculation (avoid division by zero)
-            df['kda'] = ((df['kills'] + df['assists']) /
-                         df['deaths'].replace(0, 1))
+            df['kda'] = _safe_ratio(takedowns, deaths)
 
             # Kill participation (if teamkills exists)
             if 'teamkills' in df.columns:
-                df['kill_participation'] = (
-                    (df['kills'] + df['assists']) / df['teamkills'].replace(0, 1)
-                ) * 100
+                teamkills = df['teamkills'].to_numpy(dtype=np.float64, na_value=np.nan)
+                df['kill_participation'] = _safe_ratio(takedowns, teamkills, scale=100.0)
+
+        # Narrow whatever is still 64-bit (frames not produced by DataLoader,
+        # or the derived metrics above) so aggregations move fewer bytes.
+        # Integers are only narrowed as far as their values allow; columns
+        # the loader already stored in smaller types are left alone.
+        for col in df.columns:
+            dtype = df[col].dtype
+            if pd.api.types.is_integer_dtype(dtype) and dtype.itemsize > 4:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            elif pd.api.types.is_float_dtype(dtype) and dtype.itemsize > 4:
+                df[col] = pd.to_numeric(df[col], downcast='float')
+
+        # Group keys as categoricals, so groupby works on integer codes
+        # instead of hashing strings
+        for col in ('playerid', 'playername', 'position', 'champion', 'teamname'):
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
 
-        # Filter player rows only (exclude team summary rows)
-        if 'position' in df.columns:
-            df = df[df['position'].notna()]
-            df = df[df['position'] != 'team']
+        return df
 
-        # Remove rows with critical missing values
-        critical_cols = ['playerid', 'position', 'champion']
-        df = df.dropna(subset=[col for col in critical_cols if col in df.columns])
+    def _grouped(self, *keys: str) -> pd.core.groupby.DataFrameGroupBy:
+        """
+        Returns a GroupBy of the cleaned data by the given keys, reusing a cached one.
 
-        print(f"Data cleaned: {len(df)} rows remaining")
+        Keys are factorized once per GroupBy object, so every aggregation
+        and plot grouping by the same keys shares that work.
 
-        self.df_clean = df
-        return df
+        Args:
+            *keys (str): Column names to group by.
+
+        Returns:
+            pd.core.groupby.DataFrameGroupBy: Unsorted, observed-only grouping.
+        """
+        if keys not in self._groupers:
+            by = list(keys) if len(keys) > 1 else keys[0]
+            self._groupers[keys] = self.df_clean.groupby(by, sort=False, observed=True)
+        return self._groupers[keys]
 
     def generate_summary_statistics(self) -> pd.DataFrame:
         """
@@ -151,7 +474,7 @@ class EsportsEDA:
 
         # Save to CSV
         output_path = self.processed_dir / "summary_statistics.csv"
-        summary.to_csv(output_path)
+        self._write_csv(summary, output_path, index=True)
         print(f"Summary statistics saved to {output_path}")
 
         return summary
@@ -168,7 +491,10 @@ class EsportsEDA:
         """
         print("\n=== Missing Data Analysis ===")
 
-        missing_percent = (self.df.isnull().sum() / len(self.df)) * 100
+        # count() reads each column's null bitmap or NaN check directly rather
+        # than materialising a full boolean mask of the frame
+        n_rows = len(self.df)
+        missing_percent = (1 - self.df.count() / n_rows) * 100 if n_rows else self.df.count()
         missing_percent = missing_percent[missing_percent > 0].sort_values(ascending=False)
 
         if len(missing_percent) == 0:
@@ -179,55 +505,63 @@ class EsportsEDA:
         print(missing_percent)
 
         # Visualize missing data
-        fig, ax = plt.subplots(figsize=(12, max(6, len(missing_percent) * 0.3)))
+        ax = self._new_axes(figsize=(12, max(6, len(missing_percent) * 0.3)))
         missing_percent.plot(kind='barh', ax=ax, color='coral')
         ax.set_xlabel('Missing Percentage (%)', fontsize=12)
         ax.set_ylabel('Column', fontsize=12)
         ax.set_title('Missing Data Analysis', fontsize=14, fontweight='bold')
         ax.grid(axis='x', alpha=0.3)
 
-        plt.tight_layout()
         save_path = self.output_dir / "missing_data_analysis.png"
-        plt.savefig(save_path, dpi=DPI, bbox_inches='tight')
+        self._save_figure(save_path)
         print(f"Missing data visualization saved to {save_path}")
-        plt.close()
 
-    def analyze_player_performance(self, top_n: int = 20) -> pd.DataFrame:
+    def _player_stats(self) -> pd.DataFrame:
         """
-        Analyzes individual player performance metrics across all games.
-
-        Computes aggregate statistics for each player including average KDA,
-        damage per minute, CS per minute, and game counts. Filters for players
-        with minimum game threshold.
+        Computes per-player aggregate statistics, reusing a cached result.
 
-        Args:
-            top_n (int): Number of top players to display in rankings.
+        The table is built once per cleaned dataset and shared by the player
+        analysis and the top-players chart.
 
         Returns:
             pd.DataFrame: Player performance statistics sorted by KDA.
         """
-        print(f"\n=== Player Performance Analysis ===")
-
-        df = self.df_clean.copy()
-
-        # Group by player
-        player_stats = df.groupby(['playerid', 'playername']).agg({
-            'gameid': 'count',
-            'kills': 'mean',
-            'deaths': 'mean',
-            'assists': 'mean',
-            'kda': 'mean',
-            'dpm': 'mean',
-            'cspm': 'mean',
-            'vspm': 'mean',
-            'result': 'mean'  # Win rate
-        }).reset_index()
-
-        player_stats.columns = [
-            'player_id', 'player_name', 'games_played', 'avg_kills',
-            'avg_deaths', 'avg_assists', 'avg_kda', 'avg_dpm',
-            'avg_cspm', 'avg_vspm', 'win_rate'
+        if 'player' in self._stats_cache:
+            return self._stats_cache['player']
+
+        df = self.df_clean
+
+        # Number each player/name pair (unsorted, observed pairs only; rows
+        # with a missing key are numbered -1) and aggregate the stat columns by those
+        # codes with bincount rather than pandas' per-column aggregators
+        grouped = self._grouped('playerid', 'playername')
+        codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.intp)
+        ngroups = grouped.ngroups
+
+        metrics = ['kills', 'deaths', 'assists', 'kda', 'dpm', 'cspm', 'vspm', 'result']
+        values = np.column_stack([
+            df[metrics].to_numpy(dtype=np.float64, na_value=np.nan),
+            np.where(df['gameid'].notna().to_numpy(), 0.0, np.nan)
+        ])
+        sums, counts = group_sum_count(codes, values, ngroups)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums[:, :-1] / counts[:, :-1]
+
+        # The first row of each group supplies its key values, in code order
+        codes_seen, first_rows = np.unique(codes, return_index=True)
+        first_rows = first_rows[codes_seen >= 0]
+
+        keys = df[['playerid', 'playername']].iloc[first_rows]
+        stat_names = [
+            'avg_kills', 'avg_deaths', 'avg_assists', 'avg_kda',
+            'avg_dpm', 'avg_cspm', 'avg_vspm', 'win_rate'
         ]
+        player_stats = pd.DataFrame({
+            'player_id': keys['playerid'].array,
+            'player_name': keys['playername'].array,
+            'games_played': counts[:, -1],
+            **{name: means[:, j] for j, name in enumerate(stat_names)}
+        })
 
         # Filter players with minimum games
         player_stats = player_stats[player_stats['games_played'] >= MIN_GAMES_THRESHOLD]
@@ -238,15 +572,37 @@ class EsportsEDA:
         # Sort by KDA
         player_stats = player_stats.sort_values('avg_kda', ascending=False)
 
+        self._stats_cache['player'] = player_stats
+        return player_stats
+
+    def analyze_player_performance(self, top_n: int = 20) -> pd.DataFrame:
+        """
+        Analyzes individual player performance metrics across all games.
+
+        Computes aggregate statistics for each player including average KDA,
+        damage per minute, CS per minute, and game counts. Filters for players
+        with minimum game threshold.
+
+        Args:
+            top_n (int): Number of top players to display in rankings.
+
+        Returns:
+            pd.DataFrame: Player performance statistics sorted by KDA.
+        """
+        print(f"\n=== Player Performance Analysis ===")
+
+        player_stats = self._player_stats()
+
         print(f"\nTop {top_n} Players by KDA:")
         print(player_stats.head(top_n)[['player_name', 'games_played', 'avg_kda', 'win_rate']])
 
         # Save to CSV
         output_path = self.processed_dir / "player_performance.csv"
-        player_stats.to_csv(output_path, index=False)
+        self._write_csv(player_stats, output_path)
         print(f"\nPlayer performance data saved to {output_path}")
 
-        return player_stats
+        # The table is shared with the visualizations, so callers get their own copy
+        return player_stats.copy()
 
     def visualize_top_players_kda(self, top_n: int = 15) -> None:
         """
@@ -261,22 +617,12 @@ class EsportsEDA:
         Returns:
             None: Saves visualization to output directory.
         """
-        df = self.df_clean.copy()
-
-        # Calculate player KDA
-        player_kda = df.groupby('playername').agg({
-            'kda': 'mean',
-            'gameid': 'count'
-        }).reset_index()
-        player_kda.columns = ['player', 'avg_kda', 'games']
-
-        # Filter and sort
-        player_kda = player_kda[player_kda['games'] >= MIN_GAMES_THRESHOLD]
-        top_players = player_kda.nlargest(top_n, 'avg_kda')
+        # Reuse the player aggregates, already sorted by KDA, rather than regrouping
+        top_players = self._player_stats().head(top_n)
 
         # Create visualization
-        fig, ax = plt.subplots(figsize=(12, 8))
-        bars = ax.barh(top_players['player'], top_players['avg_kda'], color='skyblue')
+        ax = self._new_axes(figsize=(12, 8))
+        bars = ax.barh(top_players['player_name'], top_players['avg_kda'], color='skyblue')
 
         # Color the top 3 differently
         if len(bars) >= 3:
@@ -296,63 +642,69 @@ class EsportsEDA:
                    f' {value:.2f}',
                    va='center', fontsize=9)
 
-        plt.tight_layout()
         save_path = self.output_dir / "top_players_kda.png"
-        plt.savefig(save_path, dpi=DPI, bbox_inches='tight')
+        self._save_figure(save_path)
         print(f"Top players KDA visualization saved to {save_path}")
-        plt.close()
 
-    def analyze_champion_meta(self, top_n: int = 20) -> pd.DataFrame:
+    def _champion_stats(self) -> pd.DataFrame:
         """
-        Analyzes champion pick rates, ban rates, and win rates.
-
-        Examines which champions are most popular in professional play,
-        their success rates, and overall meta trends.
-
-        Args:
-            top_n (int): Number of top champions to analyze.
+        Computes per-champion pick and performance statistics, reusing a cached result.
 
         Returns:
-            pd.DataFrame: Champion statistics including picks, bans, and win rates.
+            pd.DataFrame: Champion statistics sorted by games picked.
         """
-        print(f"\n=== Champion Meta Analysis ===")
-
-        df = self.df_clean.copy()
+        if 'champion' in self._stats_cache:
+            return self._stats_cache['champion']
 
         # Champion pick analysis
-        champion_stats = df.groupby('champion').agg({
-            'gameid': 'count',
-            'result': 'mean',
-            'kills': 'mean',
-            'deaths': 'mean',
-            'assists': 'mean',
-            'kda': 'mean'
-        }).reset_index()
-
-        champion_stats.columns = [
-            'champion', 'games_picked', 'win_rate', 'avg_kills',
-            'avg_deaths', 'avg_assists', 'avg_kda'
-        ]
+        champion_stats = self._grouped('champion').agg(
+            games_picked=('gameid', 'count'),
+            win_rate=('result', 'mean'),
+            avg_kills=('kills', 'mean'),
+            avg_deaths=('deaths', 'mean'),
+            avg_assists=('assists', 'mean'),
+            avg_kda=('kda', 'mean')
+        ).reset_index()
 
         # Convert win rate to percentage
         champion_stats['win_rate'] = champion_stats['win_rate'] * 100
 
         # Calculate pick rate (percentage of total games)
-        total_games = len(df['gameid'].unique())
+        total_games = self._n_games
         champion_stats['pick_rate'] = (champion_stats['games_picked'] / total_games) * 100
 
         # Sort by games picked
         champion_stats = champion_stats.sort_values('games_picked', ascending=False)
 
+        self._stats_cache['champion'] = champion_stats
+        return champion_stats
+
+    def analyze_champion_meta(self, top_n: int = 20) -> pd.DataFrame:
+        """
+        Analyzes champion pick rates, ban rates, and win rates.
+
+        Examines which champions are most popular in professional play,
+        their success rates, and overall meta trends.
+
+        Args:
+            top_n (int): Number of top champions to analyze.
+
+        Returns:
+            pd.DataFrame: Champion statistics including picks, bans, and win rates.
+        """
+        print(f"\n=== Champion Meta Analysis ===")
+
+        champion_stats = self._champion_stats()
+
         print(f"\nTop {top_n} Most Picked Champions:")
         print(champion_stats.head(top_n)[['champion', 'games_picked', 'pick_rate', 'win_rate']])
 
         # Save to CSV
         output_path = self.processed_dir / "champion_meta.csv"
-        champion_stats.to_csv(output_path, index=False)
+        self._write_csv(champion_stats, output_path)
         print(f"\nChampion meta data saved to {output_path}")
 
-        return champion_stats
+        return champion_stats.copy()
 
     def visualize_champion_pickrate(self, top_n: int = 20) -> None:
         """
@@ -367,11 +719,21 @@ class EsportsEDA:
         Returns:
             None: Saves visualization to output directory.
         """
-        df = self.df_clean.copy()
-
-        champion_picks = df['champion'].value_counts().head(top_n)
-
-        fig, ax = plt.subplots(figsize=(12, 8))
+        # Reuse the champion aggregates when they have already been computed;
+        # otherwise counting picks is all this chart needs
+        if 'champion' in self._stats_cache:
+            champion_picks = (self._stats_cache['champion']
+                              .head(top_n)
+                              .set_index('champion')['games_picked'])
+        else:
+            # Count picks straight from the categorical codes; no string hashing
+            champions = self.df_clean['champion'].cat
+            codes = champions.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(champions.categories))
+            top = self._top_k(counts, top_n)
+            champion_picks = pd.Series(counts[top], index=champions.categories[top], name='count')
+
+        ax = self._new_axes(figsize=(12, 8))
         champion_picks.plot(kind='barh', ax=ax, color='mediumseagreen')
 
         ax.set_xlabel('Number of Games Picked', fontsize=12)
@@ -384,11 +746,35 @@ class EsportsEDA:
         for i, value in enumerate(champion_picks.values):
             ax.text(value, i, f' {value}', va='center', fontsize=9)
 
-        plt.tight_layout()
         save_path = self.output_dir / "champion_pickrate.png"
-        plt.savefig(save_path, dpi=DPI, bbox_inches='tight')
+        self._save_figure(save_path)
         print(f"Champion pick rate visualization saved to {save_path}")
-        plt.close()
+
+    def _position_stats(self) -> pd.DataFrame:
+        """
+        Computes per-position aggregate statistics, reusing a cached result.
+
+        Returns:
+            pd.DataFrame: Position-wise aggregate statistics.
+        """
+        if 'position' in self._stats_cache:
+            return self._stats_cache['position']
+
+        position_stats = self._grouped('position').agg(
+            games=('gameid', 'count'),
+            avg_kills=('kills', 'mean'),
+            avg_deaths=('deaths', 'mean'),
+            avg_assists=('assists', 'mean'),
+            avg_kda=('kda', 'mean'),
+            avg_dpm=('dpm', 'mean'),
+            avg_cspm=('cspm', 'mean'),
+            avg_vspm=('vspm', 'mean'),
+            avg_damage=('damagetochampions', 'mean'),
+            avg_gold=('totalgold', 'mean')
+        ).reset_index()
+
+        self._stats_cache['position'] = position_stats
+        return position_stats
 
     def analyze_position_metrics(self) -> pd.DataFrame:
         """
@@ -402,36 +788,17 @@ class EsportsEDA:
         """
         print(f"\n=== Position-Based Analysis ===")
 
-        df = self.df_clean.copy()
-
-        position_stats = df.groupby('position').agg({
-            'gameid': 'count',
-            'kills': 'mean',
-            'deaths': 'mean',
-            'assists': 'mean',
-            'kda': 'mean',
-            'dpm': 'mean',
-            'cspm': 'mean',
-            'vspm': 'mean',
-            'damagetochampions': 'mean',
-            'totalgold': 'mean'
-        }).reset_index()
-
-        position_stats.columns = [
-            'position', 'games', 'avg_kills', 'avg_deaths', 'avg_assists',
-            'avg_kda', 'avg_dpm', 'avg_cspm', 'avg_vspm',
-            'avg_damage', 'avg_gold'
-        ]
+        position_stats = self._position_stats()
 
         print("\nAverage Stats by Position:")
         print(position_stats)
 
         # Save to CSV
         output_path = self.processed_dir / "position_metrics.csv"
-        position_stats.to_csv(output_path, index=False)
+        self._write_csv(position_stats, output_path)
         print(f"\nPosition metrics saved to {output_path}")
 
-        return position_stats
+        return position_stats.copy()
 
     def visualize_position_comparison(self) -> None:
         """
@@ -443,37 +810,67 @@ class EsportsEDA:
         Returns:
             None: Saves visualization to output directory.
         """
-        df = self.df_clean.copy()
+        df = self.df_clean
 
         # Select key metrics
-        metrics = ['kills', 'deaths', 'assists', 'dpm']
+        metrics = [m for m in ['kills', 'deaths', 'assists', 'dpm'] if m in df.columns]
 
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        # Quartiles for every metric and position in one grouped pass, so the
+        # boxes are drawn from summary stats rather than re-sorting raw data
+        positions = df['position'].cat.categories
+        codes = df['position'].cat.codes.to_numpy()
+        quartiles = self._grouped('position')[metrics].quantile([0.25, 0.5, 0.75])
+        colors = sns.color_palette('Set2', len(positions))
+
+        axes = self._new_axes(2, 2, figsize=(14, 10))
         axes = axes.ravel()
 
         for idx, metric in enumerate(metrics):
-            if metric in df.columns:
-                sns.boxplot(
-                    data=df,
-                    x='position',
-                    y=metric,
-                    ax=axes[idx],
-                    palette='Set2'
-                )
-                axes[idx].set_title(f'{metric.upper()} by Position',
-                                   fontsize=12, fontweight='bold')
-                axes[idx].set_xlabel('Position', fontsize=10)
-                axes[idx].set_ylabel(metric.upper(), fontsize=10)
-                axes[idx].grid(axis='y', alpha=0.3)
-
-        plt.suptitle('Performance Metrics Comparison Across Positions',
-                     fontsize=14, fontweight='bold', y=1.00)
-        plt.tight_layout()
+            q1, med, q3 = (
+                quartiles[metric].xs(q, level=-1).reindex(positions).to_numpy(dtype=np.float64)
+                for q in (0.25, 0.5, 0.75)
+            )
+
+            # Whiskers reach the most extreme values within 1.5 IQR of the box
+            values = df[metric].to_numpy(dtype=np.float64, na_value=np.nan)
+            iqr = q3 - q1
+            lower, upper = (q1 - 1.5 * iqr)[codes], (q3 + 1.5 * iqr)[codes]
+            by_code = pd.DataFrame({
+                'low': np.where(values >= lower, values, np.nan),
+                'high': np.where(values <= upper, values, np.nan)
+            }).groupby(codes).agg({'low': 'min', 'high': 'max'}).reindex(range(len(positions)))
+
+            # Values beyond the whiskers are drawn as fliers, split per position
+            outside = ((values < lower) | (values > upper)) & (codes >= 0)
+            order = np.argsort(codes[outside], kind='stable')
+            fliers = np.split(values[outside][order],
+                              np.cumsum(np.bincount(codes[outside], minlength=len(positions)))[:-1])
+
+            stats = [
+                {'label': pos, 'q1': q1[i], 'med': med[i], 'q3': q3[i],
+                 'whislo': by_code['low'].iat[i], 'whishi': by_code['high'].iat[i],
+                 'fliers': fliers[i]}
+                for i, pos in enumerate(positions)
+            ]
+            boxes = axes[idx].bxp(stats, showfliers=True, patch_artist=True, widths=0.8,
+                                  medianprops={'color': '0.25'},
+                                  flierprops={'marker': 'o', 'markersize': 5,
+                                              'markeredgecolor': '0.25'})
+            for box, color in zip(boxes['boxes'], colors):
+                box.set_facecolor(color)
+
+            axes[idx].set_title(f'{metric.upper()} by Position',
+                                fontsize=12, fontweight='bold')
+            axes[idx].set_xlabel('Position', fontsize=10)
+            axes[idx].set_ylabel(metric.upper(), fontsize=10)
+            axes[idx].grid(axis='y', alpha=0.3)
+
+        self._fig.suptitle('Performance Metrics Comparison Across Positions',
+                           fontsize=14, fontweight='bold')
 
         save_path = self.output_dir / "position_comparison.png"
-        plt.savefig(save_path, dpi=DPI, bbox_inches='tight')
+        self._save_figure(save_path)
         print(f"Position comparison visualization saved to {save_path}")
-        plt.close()
 
     def analyze_game_duration_impact(self) -> None:
         """
@@ -487,20 +884,26 @@ class EsportsEDA:
         """
         print(f"\n=== Game Duration Impact Analysis ===")
 
-        df = self.df_clean.copy()
-
-        if 'gamelength' not in df.columns:
+        if 'gamelength' not in self.df_clean.columns:
             print("Game length data not available")
             return
 
-        # Convert game length to minutes
-        df['game_minutes'] = df['gamelength'] / 60
-
-        # Create bins for game duration
-        df['duration_category'] = pd.cut(
-            df['game_minutes'],
-            bins=[0, 25, 30, 35, 100],
-            labels=['Short (<25m)', 'Medium (25-30m)', 'Long (30-35m)', 'Very Long (35m+)']
+        # Work on only the columns this analysis needs, with game length
+        # converted to minutes, so the derived columns do not copy the full frame
+        df = self.df_clean[
+            ['gameid', 'gamelength', 'kills', 'totalgold', 'damagetochampions', 'total cs']
+        ].assign(game_minutes=self.df_clean['gamelength'] / 60)
+
+        # Create bins for game duration. np.digitize with right=True matches
+        # pd.cut's right-closed bins; minutes outside (0, 100] or missing get
+        # code -1, which Categorical.from_codes treats as NaN.
+        minutes = df['game_minutes'].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes = np.digitize(minutes, [0, 25, 30, 35, 100], right=True) - 1
+        codes[(codes < 0) | (codes > 3)] = -1
+        df['duration_category'] = pd.Categorical.from_codes(
+            codes,
+            categories=['Short (<25m)', 'Medium (25-30m)', 'Long (30-35m)', 'Very Long (35m+)'],
+            ordered=True
         )
 
         duration_stats = df.groupby('duration_category').agg({
@@ -515,7 +918,7 @@ class EsportsEDA:
         print(duration_stats)
 
         # Visualize
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        axes = self._new_axes(2, 2, figsize=(14, 10))
         metrics = ['kills', 'totalgold', 'damagetochampions', 'total cs']
         titles = ['Average Kills', 'Average Total Gold', 'Average Damage', 'Average CS']
 
@@ -536,14 +939,44 @@ class EsportsEDA:
                 ax.tick_params(axis='x', rotation=45)
                 ax.grid(axis='y', alpha=0.3)
 
-        plt.suptitle('Impact of Game Duration on Performance Metrics',
-                     fontsize=14, fontweight='bold')
-        plt.tight_layout()
+        self._fig.suptitle('Impact of Game Duration on Performance Metrics',
+                           fontsize=14, fontweight='bold')
 
         save_path = self.output_dir / "game_duration_impact.png"
-        plt.savefig(save_path, dpi=DPI, bbox_inches='tight')
+        self._save_figure(save_path)
         print(f"Game duration analysis saved to {save_path}")
-        plt.close()
+
+    def _team_stats(self) -> pd.DataFrame:
+        """
+        Computes per-team aggregate statistics, reusing a cached result.
+
+        Returns:
+            pd.DataFrame: Team performance statistics sorted by win rate.
+        """
+        if 'team' in self._stats_cache:
+            return self._stats_cache['team']
+
+        team_stats = self._grouped('teamname').agg(
+            games_played=('gameid', 'count'),
+            win_rate=('result', 'mean'),
+            avg_kills=('kills', 'mean'),
+            avg_deaths=('deaths', 'mean'),
+            avg_assists=('assists', 'mean'),
+            avg_gold=('totalgold', 'mean'),
+            avg_damage=('damagetochampions', 'mean')
+        ).rename_axis('team').reset_index()
+
+        # Filter teams with minimum games
+        team_stats = team_stats[team_stats['games_played'] >= MIN_GAMES_THRESHOLD]
+
+        # Convert win rate to percentage
+        team_stats['win_rate'] = team_stats['win_rate'] * 100
+
+        # Sort by win rate
+        team_stats = team_stats.sort_values('win_rate', ascending=False)
+
+        self._stats_cache['team'] = team_stats
+        return team_stats
 
     def analyze_team_performance(self, top_n: int = 15) -> pd.DataFrame:
         """
@@ -560,41 +993,17 @@ class EsportsEDA:
         """
         print(f"\n=== Team Performance Analysis ===")
 
-        df = self.df_clean.copy()
-
-        team_stats = df.groupby('teamname').agg({
-            'gameid': 'count',
-            'result': 'mean',
-            'kills': 'mean',
-            'deaths': 'mean',
-            'assists': 'mean',
-            'totalgold': 'mean',
-            'damagetochampions': 'mean'
-        }).reset_index()
-
-        team_stats.columns = [
-            'team', 'games_played', 'win_rate', 'avg_kills',
-            'avg_deaths', 'avg_assists', 'avg_gold', 'avg_damage'
-        ]
-
-        # Filter teams with minimum games
-        team_stats = team_stats[team_stats['games_played'] >= MIN_GAMES_THRESHOLD]
-
-        # Convert win rate to percentage
-        team_stats['win_rate'] = team_stats['win_rate'] * 100
-
-        # Sort by win rate
-        team_stats = team_stats.sort_values('win_rate', ascending=False)
+        team_stats = self._team_stats()
 
         print(f"\nTop {top_n} Teams by Win Rate:")
         print(team_stats.head(top_n)[['team', 'games_played', 'win_rate']])
 
         # Save to CSV
         output_path = self.processed_dir / "team_performance.csv"
-        team_stats.to_csv(output_path, index=False)
+        self._write_csv(team_stats, output_path)
         print(f"\nTeam performance data saved to {output_path}")
 
-        return team_stats
+        return team_stats.copy()
 
     def create_correlation_heatmap(self) -> None:
         """
@@ -608,7 +1017,7 @@ class EsportsEDA:
         """
         print(f"\n=== Correlation Analysis ===")
 
-        df = self.df_clean.copy()
+        df = self.df_clean
 
         # Select key numeric columns
         numeric_cols = [
@@ -616,38 +1025,81 @@ class EsportsEDA:
             'vspm', 'totalgold', 'damagetochampions', 'gamelength'
         ]
 
-        # Filter only available columns
-        available_cols = [col for col in numeric_cols if col in df.columns]
+        # Filter only available columns, skipping any with no values at all
+        # (load_csv fills columns missing from the file with nulls)
+        available_cols = [col for col in numeric_cols
+                          if col in df.columns and df[col].notna().any()]
 
         if len(available_cols) < 2:
             print("Not enough numeric columns for correlation analysis")
             return
 
-        # Calculate correlation matrix
-        corr_matrix = df[available_cols].corr()
+        # When every row is complete, np.corrcoef on a plain ndarray does one
+        # BLAS product instead of pairwise column passes. Otherwise fall back
+        # to pandas' pairwise-complete correlation so gaps in one column do
+        # not discard the rows used by the others.
+        values = df[available_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(values).any():
+            corr_matrix = df[available_cols].astype(np.float64).corr()
+        else:
+            corr_matrix = pd.DataFrame(
+                np.corrcoef(values, rowvar=False),
+                index=available_cols,
+                columns=available_cols
+            )
 
         # Create heatmap
-        fig, ax = plt.subplots(figsize=(12, 10))
-        sns.heatmap(
-            corr_matrix,
-            annot=True,
-            fmt='.2f',
-            cmap='coolwarm',
-            center=0,
-            square=True,
-            linewidths=1,
-            cbar_kws={"shrink": 0.8},
-            ax=ax
-        )
+        ax = self._new_axes(figsize=(12, 10))
+        values = corr_matrix.to_numpy()
+        n_cols = len(available_cols)
+
+        image = ax.imshow(np.ma.masked_invalid(values), cmap='coolwarm', vmin=-1, vmax=1)
+        self._fig.colorbar(image, ax=ax, shrink=0.8)
+
+        ax.set_xticks(range(n_cols), labels=available_cols, rotation=90)
+        ax.set_yticks(range(n_cols), labels=available_cols)
+
+        # White cell borders on the minor grid, and no frame or tick marks
+        ax.set_xticks(np.arange(n_cols + 1) - 0.5, minor=True)
+        ax.set_yticks(np.arange(n_cols + 1) - 0.5, minor=True)
+        ax.grid(which='major', visible=False)
+        ax.grid(which='minor', color='white', linewidth=1)
+        ax.tick_params(which='both', length=0)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+        # Format every annotation in one vectorised call; cells without a
+        # correlation (constant columns) are left blank
+        labels = np.char.mod('%.2f', values)
+        text_colors = np.where(np.abs(values) > 0.5, 'white', 'black')
+        for i, j in zip(*np.nonzero(~np.isnan(values))):
+            ax.text(j, i, labels[i, j], ha='center', va='center', color=text_colors[i, j])
 
         ax.set_title('Correlation Heatmap of Performance Metrics',
                      fontsize=14, fontweight='bold', pad=20)
 
-        plt.tight_layout()
         save_path = self.output_dir / "correlation_heatmap.png"
-        plt.savefig(save_path, dpi=DPI, bbox_inches='tight')
+        self._save_figure(save_path)
         print(f"Correlation heatmap saved to {save_path}")
-        plt.close()
+
+    def _precompute_stats(self) -> None:
+        """
+        Computes the player, champion, position and team tables in parallel.
+
+        The aggregations group by different keys and spend most of their time
+        in GIL-releasing pandas/NumPy kernels, so they overlap on a thread
+        pool. Only the caches are filled here; printing, CSV output and
+        plotting stay sequential because they share the figure and stdout.
+
+        Returns:
+            None: Populates the aggregate table cache.
+        """
+        builders = [self._player_stats, self._champion_stats,
+                    self._position_stats, self._team_stats]
+
+        with ThreadPoolExecutor(max_workers=min(ANALYSIS_WORKERS, len(builders))) as pool:
+            for future in [pool.submit(build) for build in builders]:
+                future.result()
 
     def run_complete_eda(self) -> None:
         """
@@ -666,6 +1118,10 @@ class EsportsEDA:
         # Clean data
         self.clean_data()
 
+        # Build the shared aggregate tables concurrently; the reporting and
+        # plotting below then runs in order on the cached results
+        self._precompute_stats()
+
         # Summary statistics
         self.generate_summary_statistics()
 
@@ -724,7 +1180,7 @@ def main():
         return
 
     # Run EDA
-    eda = EsportsEDA(df)
+    eda = EsportsEDA(df, source=loader.year_source(2025))
     eda.run_complete_eda()
 
 
@@ -0,0 +1,47 @@
+"""
+Array-level group aggregation helpers for the EDA pipeline.
+
+Aggregates numeric columns by integer group codes (as produced by
+GroupBy.ngroup or categorical codes) with np.bincount, which makes one
+linear C pass per column without going through pandas' hash-based aggregator.
+
+Returns:
+    np.ndarray: Per-group sums and non-missing counts.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+def group_sum_count(codes: np.ndarray, values: np.ndarray,
+                    ngroups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sums each column per group and counts the non-missing values summed.
+
+    Rows with a negative code (a missing group key) are ignored, and NaN
+    values are skipped, matching pandas' groupby sum/count semantics.
+
+    Args:
+        codes (np.ndarray): Group code for each row, in the range [0, ngroups).
+        values (np.ndarray): 2-D float array of shape (rows, columns).
+        ngroups (int): Number of groups.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Sums and non-missing counts, each of
+            shape (ngroups, columns).
+    """
+    keep = codes >= 0
+    codes = codes[keep]
+    values = values[keep]
+
+    sums = np.empty((ngroups, values.shape[1]), dtype=np.float64)
+    counts = np.empty((ngroups, values.shape[1]), dtype=np.int64)
+
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        present = ~np.isnan(column)
+        sums[:, j] = np.bincount(codes, weights=np.where(present, column, 0.0), minlength=ngroups)
+        counts[:, j] = np.bincount(codes[present], minlength=ngroups)
+
+    return sums, counts
+